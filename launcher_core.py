@@ -0,0 +1,358 @@
+"""
+Shared core for the AI Assistant launcher scripts
+Process spawning, readiness probes, tool discovery, build fingerprints and
+shutdown used by start_app.py, start_complete_app.py and start_complete_working_app.py
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import socket
+import shutil
+import hashlib
+import atexit
+import logging
+import functools
+import subprocess
+from pathlib import Path
+from typing import Iterable, Optional
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+BACKEND_PORT = 8000
+BACKEND_URL = f'http://localhost:{BACKEND_PORT}'
+
+def wait_ready(port: int, timeout: float = 15.0, interval: float = 0.05,
+               process: Optional[subprocess.Popen] = None) -> bool:
+    """Wait until localhost:port accepts connections; gives up early if process exits"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            return False
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.1)
+            if sock.connect_ex(('127.0.0.1', port)) == 0:
+                return True
+        time.sleep(interval)
+    return False
+
+def log_tail(path: Path, max_bytes: int = 4096) -> str:
+    """Last max_bytes of a child process log, for startup failure diagnostics"""
+    try:
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(f.tell() - max_bytes, 0))
+            return f.read().decode('utf-8', 'replace')
+    except OSError:
+        return ''
+
+def open_log(log_path: Path):
+    """Open a child process log for unbuffered appending, creating its directory"""
+    log_path.parent.mkdir(exist_ok=True)
+    return open(log_path, 'ab', buffering=0)
+
+def path_fingerprint() -> str:
+    """Fingerprint of PATH and the mtimes of its directories"""
+    digest = hashlib.sha256()
+    for entry in os.environ.get('PATH', '').split(os.pathsep):
+        try:
+            mtime = os.stat(entry).st_mtime_ns
+        except OSError:
+            mtime = 0
+        digest.update(f"{entry}\0{mtime}\n".encode('utf-8', 'surrogateescape'))
+    return digest.hexdigest()
+
+def load_tool_cache(cache_file: Path, fingerprint: str) -> Optional[dict]:
+    """Cached node/npm paths and versions, if PATH is unchanged and both are still executable"""
+    try:
+        cached = json.loads(cache_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if cached.get('path_fingerprint') != fingerprint:
+        return None
+    for tool in ('node', 'npm'):
+        if not (cached.get(tool) and cached.get(f'{tool}_version') and os.access(cached[tool], os.X_OK)):
+            return None
+    return cached
+
+def content_fingerprint(*paths: Path) -> str:
+    """blake2b digest over the contents of the given files"""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            pass
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+def tree_fingerprint(paths: Iterable[Path]) -> str:
+    """blake2b digest over (path, mtime_ns, size) of every file under the given paths"""
+    digest = hashlib.blake2b(digest_size=16)
+
+    def add(path, st):
+        digest.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode('utf-8', 'surrogateescape'))
+
+    stack = [os.fspath(path) for path in reversed(list(paths))]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except NotADirectoryError:
+            try:
+                add(path, os.stat(path))
+            except OSError:
+                pass
+            continue
+        except OSError:
+            continue
+
+        for entry in reversed(entries):
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            else:
+                # Dangling symlinks, such as editor lock files, have nothing to stat
+                try:
+                    add(entry.path, entry.stat())
+                except OSError:
+                    pass
+    return digest.hexdigest()
+
+def read_fingerprint(marker: Path) -> Optional[str]:
+    """Fingerprint stored in a marker file, or None"""
+    try:
+        return marker.read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+
+def write_fingerprint(marker: Path, fingerprint: str):
+    """Store a fingerprint in a marker file; failures only cost a rebuild next time"""
+    try:
+        marker.write_text(fingerprint, encoding='utf-8')
+    except OSError as e:
+        logger.debug(f"Could not write {marker}: {e}")
+
+def terminate_group(process: subprocess.Popen):
+    """SIGTERM a child's whole process group; children lead their own session"""
+    if hasattr(os, 'killpg'):
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    else:
+        process.terminate()
+
+def kill_group(process: subprocess.Popen):
+    """SIGKILL a child's whole process group"""
+    if hasattr(os, 'killpg'):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    else:
+        process.kill()
+
+@functools.lru_cache(maxsize=None)
+def pdeathsig_prefix() -> tuple:
+    """Command prefix asking Linux to SIGTERM a child when the launcher dies, even by SIGKILL"""
+    # setpriv sets PR_SET_PDEATHSIG and then execs the real command, so spawning
+    # keeps CPython's vfork() path, which a prctl() preexec_fn would rule out
+    if not sys.platform.startswith('linux'):
+        return ()
+    setpriv = shutil.which('setpriv')
+    if setpriv is None:
+        return ()
+    try:
+        result = subprocess.run([setpriv, '--help'], capture_output=True, text=True)
+    except OSError:
+        return ()
+    if '--pdeathsig' not in result.stdout:
+        return ()  # util-linux older than 2.33
+    return (setpriv, '--pdeathsig', 'TERM', '--')
+
+class BaseLauncher:
+    """Child process management shared by the AI Assistant launchers"""
+
+    def __init__(self):
+        self.root_dir = Path(__file__).parent
+        self.backend_dir = self.root_dir / 'backend'
+        self.frontend_dir = self.root_dir / 'frontend'
+        self.log_dir = self.root_dir / 'logs'
+        self.tool_cache_file = self.root_dir / '.tool_cache.json'
+        self.build_marker = self.frontend_dir / 'dist' / '.build_fingerprint'
+        self.backend_process: Optional[subprocess.Popen] = None
+        self.frontend_process: Optional[subprocess.Popen] = None
+        self._http = None  # requests.Session, created on first health check
+
+        # Covers crashes and early exits that skip the graceful shutdown
+        atexit.register(self._stop_at_exit)
+
+    def _find_node_tools(self) -> Optional[dict]:
+        """Resolve node/npm and their versions, cached in .tool_cache.json until PATH changes"""
+        fingerprint = path_fingerprint()
+        cached = load_tool_cache(self.tool_cache_file, fingerprint)
+        if cached is not None:
+            return cached
+
+        tools = {tool: shutil.which(tool) for tool in ('node', 'npm')}
+        if not all(tools.values()):
+            return None
+
+        # Version probes only run when the cache is cold
+        for tool in ('node', 'npm'):
+            try:
+                result = subprocess.run([tools[tool], '--version'], capture_output=True, text=True)
+            except OSError:
+                return None
+            if result.returncode != 0:
+                return None
+            tools[f'{tool}_version'] = result.stdout.strip()
+
+        tools['path_fingerprint'] = fingerprint
+        try:
+            self.tool_cache_file.write_text(json.dumps(tools), encoding='utf-8')
+        except OSError as e:
+            logger.debug(f"Could not write tool cache: {e}")
+        return tools
+
+    def _build_fingerprint(self) -> str:
+        """Fingerprint of every input to the frontend build, compared against build_marker"""
+        # webpack, ts-loader and postcss-loader (with tailwind) all read
+        # top-level config files, so any *.config.js counts as an input
+        return tree_fingerprint([
+            self.frontend_dir / 'src',
+            self.frontend_dir / 'package.json',
+            self.frontend_dir / 'package-lock.json',
+            self.frontend_dir / 'tsconfig.json',
+            *sorted(self.frontend_dir.glob('*.config.js')),
+        ])
+
+    def _spawn(self, args: list, log_name: Optional[str] = None, **kwargs) -> subprocess.Popen:
+        """Start a child leading its own session, logging to logs/<log_name> if given"""
+        # A new session lets shutdown signal the whole tree; no preexec_fn keeps
+        # CPython on its vfork() spawn path. The parent-death signal fires when
+        # the spawning thread exits, and children are only spawned from the main thread.
+        args = [*pdeathsig_prefix(), *args]
+        if log_name is None:
+            return subprocess.Popen(args, start_new_session=True, **kwargs)
+
+        # Log files rather than pipes, so a chatty child can never block on a full pipe
+        with open_log(self.log_dir / log_name) as log:
+            return subprocess.Popen(
+                args,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,
+                **kwargs
+            )
+
+    def _http_session(self):
+        """Keep-alive session reused by every health check"""
+        if self._http is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            self._http = requests.Session()
+            self._http.mount('http://', HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=0))
+        return self._http
+
+    def _backend_healthy(self, timeout: float = 2) -> bool:
+        """GET the backend /health endpoint over the shared session"""
+        response = self._http_session().get(f'{BACKEND_URL}/health', timeout=timeout)
+        return response.status_code == 200
+
+    def _children(self) -> list:
+        """Every child process this launcher has started"""
+        return [self.frontend_process, self.backend_process]
+
+    def _stop_at_exit(self):
+        """Last-chance cleanup of children still running at interpreter exit"""
+        self._stop_processes(self._children(), timeout=5)
+
+    def _stop_processes(self, processes, timeout: float = 10.0):
+        """Terminate every child with its descendants, then kill whatever outlives the shared timeout"""
+        running = [process for process in processes if process and process.poll() is None]
+        if PSUTIL_AVAILABLE:
+            self._stop_trees(running, timeout)
+        else:
+            self._stop_groups(running, timeout)
+
+    def _stop_trees(self, running, timeout: float):
+        """Signal each child's full process tree, including grandchildren that left its group"""
+        # Enumerate descendants before signalling, while they still hang off their parents
+        # psutil.Error also covers AccessDenied, e.g. a descendant that changed
+        # user, which must not abort shutdown of the rest of the tree
+        procs = []
+        for process in running:
+            try:
+                parent = psutil.Process(process.pid)
+            except psutil.Error:
+                continue
+            try:
+                procs.extend(parent.children(recursive=True))
+            except psutil.Error as e:
+                logger.error(f"Error listing children of process {process.pid}: {e}")
+            procs.append(parent)
+
+        for proc in procs:
+            try:
+                proc.terminate()
+            except psutil.NoSuchProcess:
+                pass
+            except psutil.Error as e:
+                logger.error(f"Error terminating process {proc.pid}: {e}")
+
+        # wait_procs waits on all of them at once, so the timeout is shared
+        gone, alive = psutil.wait_procs(procs, timeout=timeout)
+        for proc in alive:
+            # Force kill if graceful shutdown fails
+            logger.warning(f"Force killing process {proc.pid}")
+            try:
+                proc.kill()
+            except psutil.NoSuchProcess:
+                pass
+            except psutil.Error as e:
+                logger.error(f"Error killing process {proc.pid}: {e}")
+        killed, _ = psutil.wait_procs(alive, timeout=5)
+
+        # psutil reaped our direct children, so hand their exit status to Popen
+        status = {proc.pid: proc.returncode for proc in gone + killed}
+        for process in running:
+            if process.returncode is None and status.get(process.pid) is not None:
+                process.returncode = status[process.pid]
+            process.poll()
+
+    def _stop_groups(self, running, timeout: float):
+        """SIGTERM every child's process group, then SIGKILL survivors"""
+        # Signal every process group first so all children stop in parallel
+        for process in running:
+            try:
+                terminate_group(process)
+            except Exception as e:
+                logger.error(f"Error terminating process: {e}")
+
+        # The timeout is shared, not per process
+        deadline = time.monotonic() + timeout
+        for process in running:
+            try:
+                process.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                # Force kill if graceful shutdown fails
+                logger.warning(f"Force killing process {process.pid}")
+                kill_group(process)
+                process.wait()
+
+    def _close_http(self):
+        """Release the health check session's pooled connections"""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
@@ -11,12 +11,74 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import deflate
+    DEFLATE_AVAILABLE = True
+except ImportError:
+    DEFLATE_AVAILABLE = False
+
+# libdeflate compression level for ZIP entries
+DEFLATE_LEVEL = 6
+
+# _write_raw_entry mirrors zipfile internals, checked on CPython 3.8 to 3.13
+RAW_ZIP_ENTRIES = sys.implementation.name == 'cpython' and (3, 8) <= sys.version_info[:2] <= (3, 13)
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Design source files that are never shipped with the assets
+_IGNORED_ASSET_EXTENSIONS = frozenset(('.psd', '.ai'))
+
+def _ignore_design_sources(dirpath, names):
+    """copytree ignore callback: skip design sources by extension (no fnmatch)"""
+    return [n for n in names if os.path.splitext(n)[1].lower() in _IGNORED_ASSET_EXTENSIONS]
+
+def _write_raw_entry(zipf, zinfo, compressed):
+    """Append already compressed data to zipf; mirrors ZipFile._open_to_write and _ZipWriteFile.close"""
+    # Every internal is looked up before anything is written, so a zipfile
+    # that differs raises AttributeError while the archive is still intact
+    fp, lock, writecheck = zipf.fp, zipf._lock, zipf._writecheck
+    allow_zip64, filelist, name_to_info = zipf._allowZip64, zipf.filelist, zipf.NameToInfo
+    
+    with lock:
+        if zipf._writing:
+            raise ValueError("Can't write to the ZIP file while there is another write handle open on it")
+        
+        zip64 = max(zinfo.file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT
+        if zip64 and not allow_zip64:
+            raise zipfile.LargeZipFile("Filesize would require ZIP64 extensions")
+        
+        fp.seek(zipf.start_dir)
+        zinfo.header_offset = fp.tell()
+        writecheck(zinfo)
+        zipf._didModify = True
+        fp.write(zinfo.FileHeader(zip64))
+        fp.write(compressed)
+        zipf.start_dir = fp.tell()
+        filelist.append(zinfo)
+        name_to_info[zinfo.filename] = zinfo
+
+def _dumps_json(obj):
+    """Serialize to indented UTF-8 JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
 class DistributionCreator:
     def __init__(self):
         self.root_dir = Path(__file__).parent.parent
         self.dist_dir = self.root_dir / "dist"
         self.package_name = "AI-Assistant-Desktop-Minimal"
         
+        # Plain string paths for the per-file joins in the copy steps
+        self.root = str(self.root_dir)
+        self._backend_static = os.path.join(self.root, "backend", "static")
+        
     def create_distribution(self):
         """Create a distribution package"""
         print("📦 Creating AI Assistant Desktop Distribution Package")
@@ -61,8 +123,8 @@ class DistributionCreator:
         ]
         
         # Create requirements.txt if it doesn't exist
-        requirements_path = self.root_dir / "requirements.txt"
-        if not requirements_path.exists():
+        requirements_path = os.path.join(self.root, "requirements.txt")
+        if not os.path.exists(requirements_path):
             with open(requirements_path, 'w') as f:
                 f.write("""fastapi>=0.104.0
 uvicorn[standard]>=0.24.0
@@ -71,12 +133,15 @@ aiofiles>=23.0.0
 python-multipart>=0.0.6
 """)
         
+        package_root = str(package_dir)
+        copied = []
         for file_name in files_to_copy:
-            src = self.root_dir / file_name
-            if src.exists():
-                dst = package_dir / file_name
-                shutil.copy2(src, dst)
-                print(f"  ✓ {file_name}")
+            src = os.path.join(self.root, file_name)
+            if os.path.exists(src):
+                shutil.copy2(src, os.path.join(package_root, file_name))
+                copied.append(f"  ✓ {file_name}")
+        if copied:
+            print("\n".join(copied))
         
         # Copy backend directory (minimal version)
         self.copy_backend_minimal(package_dir)
@@ -85,8 +150,15 @@ python-multipart>=0.0.6
         assets_src = self.root_dir / "assets"
         if assets_src.exists():
             assets_dst = package_dir / "assets"
-            shutil.copytree(assets_src, assets_dst, ignore=shutil.ignore_patterns('*.psd', '*.ai'))
-            print("  ✓ assets/")
+            copied_assets = []
+            
+            def copy_asset(src, dst):
+                copied_assets.append(src)
+                return shutil.copy2(src, dst)
+            
+            shutil.copytree(assets_src, assets_dst, ignore=_ignore_design_sources,
+                            copy_function=copy_asset)
+            print(f"  ✓ assets/ ({len(copied_assets)} files)")
             
     def copy_backend_minimal(self, package_dir):
         """Copy minimal backend files"""
@@ -96,8 +168,8 @@ python-multipart>=0.0.6
         backend_dst.mkdir()
         
         # Copy static files
-        static_src = self.root_dir / "backend" / "static"
-        if static_src.exists():
+        static_src = self._backend_static
+        if os.path.exists(static_src):
             static_dst = backend_dst / "static"
             shutil.copytree(static_src, static_dst)
             print("  ✓ backend/static/")
@@ -153,8 +225,7 @@ python-multipart>=0.0.6
 </body>
 </html>'''
             
-            with open(static_dst / "index.html", 'w', encoding='utf-8') as f:
-                f.write(index_content)
+            (static_dst / "index.html").write_bytes(index_content.encode('utf-8'))
             print("  ✓ backend/static/index.html (created)")
             
     def create_package_info(self, package_dir):
@@ -187,8 +258,7 @@ python-multipart>=0.0.6
             }
         }
         
-        with open(package_dir / "package-info.json", 'w', encoding='utf-8') as f:
-            json.dump(info, f, indent=2, ensure_ascii=False)
+        (package_dir / "package-info.json").write_bytes(_dumps_json(info))
         print("  ✓ package-info.json")
         
     def create_readme(self, package_dir):
@@ -296,8 +366,7 @@ This software is provided as-is for evaluation and testing purposes.
 **Enjoy your AI Assistant! 🤖✨**
 """
         
-        with open(package_dir / "README.md", 'w', encoding='utf-8') as f:
-            f.write(readme_content)
+        (package_dir / "README.md").write_bytes(readme_content.encode('utf-8'))
         print("  ✓ README.md")
         
     def create_zip_package(self):
@@ -307,24 +376,50 @@ This software is provided as-is for evaluation and testing purposes.
         zip_path = self.dist_dir / f"{self.package_name}.zip"
         package_dir = self.dist_dir / self.package_name
         
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        # The package is small, so skip ZIP64 headers unless an entry needs them
+        try:
+            self._write_zip(zip_path, package_dir, allow_zip64=False)
+        except zipfile.LargeZipFile:
+            self._write_zip(zip_path, package_dir, allow_zip64=True)
+                    
+        print(f"  ✓ {zip_path.name}")
+        return zip_path
+        
+    def _write_zip(self, zip_path, package_dir, allow_zip64):
+        """Write package_dir into zip_path"""
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, allowZip64=allow_zip64) as zipf:
             for root, dirs, files in os.walk(package_dir):
                 for file in files:
                     file_path = Path(root) / file
                     arc_path = file_path.relative_to(self.dist_dir)
-                    zipf.write(file_path, arc_path)
-                    
-        print(f"  ✓ {zip_path.name}")
-        return zip_path
+                    if DEFLATE_AVAILABLE and RAW_ZIP_ENTRIES:
+                        self._write_deflated(zipf, file_path, arc_path)
+                    else:
+                        zipf.write(file_path, arc_path)
+                        
+    def _write_deflated(self, zipf, file_path, arc_path):
+        """Add a file compressed with libdeflate as a raw ZIP_DEFLATED entry"""
+        data = file_path.read_bytes()
+        compressed = deflate.deflate_compress(data, DEFLATE_LEVEL)
+        
+        zinfo = zipfile.ZipInfo.from_file(file_path, arc_path)
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.file_size = len(data)
+        zinfo.compress_size = len(compressed)
+        zinfo.CRC = deflate.crc32(data)
+        
+        try:
+            _write_raw_entry(zipf, zinfo, compressed)
+        except AttributeError:
+            # zipfile internals changed; its own zlib path still works
+            zipf.write(file_path, arc_path)
         
     def get_file_size(self, file_path):
         """Get human-readable file size"""
         size = file_path.stat().st_size
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} TB"
+        # Each unit step is 2**10, so the unit index is (bit_length - 1) // 10
+        idx = min(max(size.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
 
 def main():
     creator = DistributionCreator()
@@ -7,10 +7,12 @@ Simple script to start the application with proper environment setup
 import os
 import sys
 import subprocess
-import time
+from importlib.util import find_spec
 from pathlib import Path
 import json
 
+from launcher_core import BACKEND_PORT, log_tail, open_log, wait_ready
+
 class AIAssistantLauncher:
     """Launcher for AI Assistant Desktop Application"""
     
@@ -18,6 +20,8 @@ class AIAssistantLauncher:
         self.root_dir = Path(__file__).parent
         self.backend_dir = self.root_dir / "backend"
         self.frontend_dir = self.root_dir / "frontend"
+        self.frontend_dist = self.frontend_dir / "dist"
+        self.log_dir = self.root_dir / "logs"
         
     def check_dependencies(self):
         """Check if required dependencies are installed"""
@@ -28,14 +32,11 @@ class AIAssistantLauncher:
             print("❌ Python 3.8+ required")
             return False
         
-        # Check if backend dependencies are installed
-        try:
-            import fastapi
-            import uvicorn
-            print("✅ Backend dependencies found")
-        except ImportError:
+        # Check if backend dependencies are installed (locate only, don't import)
+        if find_spec("fastapi") is None or find_spec("uvicorn") is None:
             print("❌ Backend dependencies missing. Run: pip install -r backend/requirements.txt")
             return False
+        print("✅ Backend dependencies found")
         
         # Check if Node.js is available
         try:
@@ -50,7 +51,7 @@ class AIAssistantLauncher:
             return False
         
         # Check if frontend is built
-        if not (self.frontend_dir / "dist").exists():
+        if not self.frontend_dist.exists():
             print("⚠️  Frontend not built. Building now...")
             return self.build_frontend()
         
@@ -61,26 +62,26 @@ class AIAssistantLauncher:
         try:
             print("📦 Installing frontend dependencies...")
             result = subprocess.run(
-                ["npm", "install"], 
+                ["npm", "install"],
                 cwd=self.frontend_dir,
-                capture_output=True,
-                text=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
             )
             
             if result.returncode != 0:
-                print(f"❌ Failed to install frontend dependencies: {result.stderr}")
+                print(f"❌ Failed to install frontend dependencies: {result.stderr.decode('utf-8', 'replace')}")
                 return False
             
             print("🔨 Building frontend...")
             result = subprocess.run(
-                ["npm", "run", "build"], 
+                ["npm", "run", "build"],
                 cwd=self.frontend_dir,
-                capture_output=True,
-                text=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
             )
             
             if result.returncode != 0:
-                print(f"❌ Failed to build frontend: {result.stderr}")
+                print(f"❌ Failed to build frontend: {result.stderr.decode('utf-8', 'replace')}")
                 return False
             
             print("✅ Frontend built successfully")
@@ -95,27 +96,28 @@ class AIAssistantLauncher:
         print("🚀 Starting backend server...")
         
         try:
-            # Start backend server
-            process = subprocess.Popen(
-                [sys.executable, "main.py"],
-                cwd=self.backend_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            # Start backend server, logging straight to a file so it can never fill a pipe
+            log_path = self.log_dir / "backend.log"
+            with open_log(log_path) as log:
+                process = subprocess.Popen(
+                    [sys.executable, "main.py"],
+                    cwd=self.backend_dir,
+                    stdout=log,
+                    stderr=subprocess.STDOUT
+                )
             
-            # Wait a moment for server to start
-            time.sleep(3)
+            # Wait until the server accepts connections or the process exits
+            if wait_ready(BACKEND_PORT, timeout=10, process=process):
+                print("✅ Backend server started successfully")
+                return process
             
             # Check if process is still running
             if process.poll() is None:
-                print("✅ Backend server started successfully")
+                print("✅ Backend server started (not yet accepting connections)")
                 return process
             else:
-                stdout, stderr = process.communicate()
                 print(f"❌ Backend server failed to start:")
-                print(f"STDOUT: {stdout}")
-                print(f"STDERR: {stderr}")
+                print(log_tail(log_path))
                 return None
                 
         except Exception as e:
@@ -128,13 +130,13 @@ class AIAssistantLauncher:
         
         try:
             # Start Electron app
-            process = subprocess.Popen(
-                ["npm", "start"],
-                cwd=self.frontend_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            with open_log(self.log_dir / "frontend.log") as log:
+                process = subprocess.Popen(
+                    ["npm", "start"],
+                    cwd=self.frontend_dir,
+                    stdout=log,
+                    stderr=subprocess.STDOUT
+                )
             
             return process
             
@@ -11,9 +11,14 @@ import time
 import asyncio
 import logging
 import signal
-from pathlib import Path
+import concurrent.futures
+import importlib.metadata
 from typing import Optional, List
-import psutil
+
+from launcher_core import (
+    BACKEND_PORT, BaseLauncher, log_tail, read_fingerprint, wait_ready,
+    write_fingerprint
+)
 
 # Setup logging
 logging.basicConfig(
@@ -22,24 +27,50 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class AIAssistantLauncher:
+# Monitor restart policy: exponential backoff capped at 5 minutes, and give
+# up after this many consecutive restarts without a healthy check in between
+RESTART_BACKOFF_CAP = 300
+MAX_RESTART_ATTEMPTS = 8
+
+def _installed_distributions() -> set:
+    """Normalized names of all installed distributions, from one metadata scan"""
+    names = set()
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata['Name']
+        if name:
+            names.add(name.lower().replace('_', '-'))
+    return names
+
+class AIAssistantLauncher(BaseLauncher):
     """Complete AI Assistant application launcher"""
     
     def __init__(self):
-        self.backend_process: Optional[subprocess.Popen] = None
-        self.frontend_process: Optional[subprocess.Popen] = None
+        super().__init__()
         self.processes: List[subprocess.Popen] = []
         self.shutdown_requested = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._shutdown_event: Optional[asyncio.Event] = None
+        self._child_event: Optional[asyncio.Event] = None
+        # name -> (consecutive restarts, monotonic time of the last restart)
+        self._restart_state = {'backend': (0, 0.0), 'frontend': (0, 0.0)}
         
         # Setup signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
+        if hasattr(signal, 'SIGCHLD'):
+            signal.signal(signal.SIGCHLD, self._child_signal_handler)
         
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
         logger.info(f"Received signal {signum}, initiating graceful shutdown...")
         self.shutdown_requested = True
-        asyncio.create_task(self.shutdown())
+        if self._loop is not None and self._shutdown_event is not None:
+            self._loop.call_soon_threadsafe(self._shutdown_event.set)
+    
+    def _child_signal_handler(self, signum, frame):
+        """Wake the process monitor when a child exits"""
+        if self._loop is not None and self._child_event is not None:
+            self._loop.call_soon_threadsafe(self._child_event.set)
     
     def check_dependencies(self) -> bool:
         """Check if all required dependencies are available"""
@@ -51,12 +82,18 @@ class AIAssistantLauncher:
             'psutil', 'pydantic', 'requests'
         ]
         
-        missing_packages = []
-        for package in required_python_packages:
-            try:
-                __import__(package)
-            except ImportError:
-                missing_packages.append(package)
+        # Scan installed package metadata (no module imports) while
+        # resolving Node.js/npm
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            installed_future = executor.submit(_installed_distributions)
+            tools_future = executor.submit(self._find_node_tools)
+            installed = installed_future.result()
+            tools_found = tools_future.result() is not None
+        
+        missing_packages = [
+            package for package in required_python_packages
+            if package.lower() not in installed
+        ]
         
         if missing_packages:
             logger.error(f"Missing Python packages: {missing_packages}")
@@ -64,18 +101,21 @@ class AIAssistantLauncher:
             return False
         
         # Check Node.js and npm
-        try:
-            subprocess.run(['node', '--version'], check=True, capture_output=True)
-            subprocess.run(['npm', '--version'], check=True, capture_output=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if not tools_found:
             logger.error("Node.js and npm are required but not found")
             return False
         
-        # Check if frontend is built
-        frontend_dist = Path('frontend/dist')
-        if not frontend_dist.exists():
-            logger.warning("Frontend not built, building now...")
-            if not self.build_frontend():
+        # Check if frontend is built from the current sources
+        if read_fingerprint(self.build_marker) != self._build_fingerprint():
+            logger.warning("Frontend not built or out of date, building now...")
+            if self.build_frontend():
+                # Fingerprint after the build, since npm install may rewrite package-lock.json
+                write_fingerprint(self.build_marker, self._build_fingerprint())
+            elif (self.frontend_dir / 'dist').is_dir():
+                # Offline or a broken npm shouldn't block a previously built app;
+                # the marker stays stale, so the next start tries again
+                logger.warning("Frontend rebuild failed, continuing with the existing build")
+            else:
                 return False
         
         logger.info("All dependencies satisfied")
@@ -89,7 +129,7 @@ class AIAssistantLauncher:
             # Install frontend dependencies
             subprocess.run(
                 ['npm', 'install'], 
-                cwd='frontend', 
+                cwd=self.frontend_dir, 
                 check=True,
                 capture_output=True
             )
@@ -97,7 +137,7 @@ class AIAssistantLauncher:
             # Build frontend
             subprocess.run(
                 ['npm', 'run', 'build'], 
-                cwd='frontend', 
+                cwd=self.frontend_dir, 
                 check=True,
                 capture_output=True
             )
@@ -116,28 +156,27 @@ class AIAssistantLauncher:
         try:
             # Start backend with proper environment
             env = os.environ.copy()
-            env['PYTHONPATH'] = str(Path('backend').absolute())
+            env['PYTHONPATH'] = str(self.backend_dir)
             
-            self.backend_process = subprocess.Popen(
-                [sys.executable, 'backend/main.py'],
-                env=env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+            self.backend_process = self._spawn(
+                [sys.executable, str(self.backend_dir / 'main.py')],
+                log_name='backend.log',
+                env=env
             )
             
             self.processes.append(self.backend_process)
             
-            # Wait for backend to start
-            time.sleep(3)
+            # Wait for backend to accept connections
+            if wait_ready(BACKEND_PORT, process=self.backend_process):
+                logger.info("Backend service started successfully")
+                return True
             
             # Check if backend is running
             if self.backend_process.poll() is None:
-                logger.info("Backend service started successfully")
+                logger.warning("Backend service started but is not accepting connections yet")
                 return True
             else:
-                stdout, stderr = self.backend_process.communicate()
-                logger.error(f"Backend failed to start: {stderr}")
+                logger.error(f"Backend failed to start: {log_tail(self.log_dir / 'backend.log')}")
                 return False
                 
         except Exception as e:
@@ -150,26 +189,26 @@ class AIAssistantLauncher:
         
         try:
             # Start Electron app
-            self.frontend_process = subprocess.Popen(
+            self.frontend_process = self._spawn(
                 ['npm', 'start'],
-                cwd='frontend',
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                log_name='frontend.log',
+                cwd=self.frontend_dir
             )
             
             self.processes.append(self.frontend_process)
             
-            # Wait for frontend to start
-            time.sleep(2)
+            # Wait for frontend to start; returns early if it exits
+            try:
+                self.frontend_process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                pass
             
             # Check if frontend is running
             if self.frontend_process.poll() is None:
                 logger.info("Frontend application started successfully")
                 return True
             else:
-                stdout, stderr = self.frontend_process.communicate()
-                logger.error(f"Frontend failed to start: {stderr}")
+                logger.error(f"Frontend failed to start: {log_tail(self.log_dir / 'frontend.log')}")
                 return False
                 
         except Exception as e:
@@ -179,11 +218,8 @@ class AIAssistantLauncher:
     def check_health(self) -> bool:
         """Check if all components are healthy"""
         try:
-            import requests
-            
             # Check backend health
-            response = requests.get('http://localhost:8000/health', timeout=5)
-            if response.status_code != 200:
+            if not self._backend_healthy():
                 logger.warning("Backend health check failed")
                 return False
             
@@ -202,26 +238,91 @@ class AIAssistantLauncher:
             logger.warning(f"Health check failed: {e}")
             return False
     
+    def _children(self) -> List[subprocess.Popen]:
+        """Every child started, including restarted ones"""
+        return self.processes
+    
+    def _managed_children(self):
+        """(name, process, start method) for each child the monitor restarts"""
+        return (
+            ('backend', self.backend_process, self.start_backend),
+            ('frontend', self.frontend_process, self.start_frontend),
+        )
+    
+    def _exited_children(self) -> List[subprocess.Popen]:
+        """Return launched children that have exited"""
+        children = [process for _, process, _ in self._managed_children() if process]
+        
+        # Children already reaped (e.g. waiting on a restart backoff) need no syscall
+        exited = [process for process in children if process.returncode is not None]
+        
+        if hasattr(os, 'waitid'):
+            try:
+                # One syscall answers "has any child exited?"; WNOWAIT leaves
+                # the status for Popen.poll() to collect below
+                if os.waitid(os.P_ALL, 0, os.WEXITED | os.WNOHANG | os.WNOWAIT) is None:
+                    return exited
+            except ChildProcessError:
+                pass  # every child already reaped; poll() reports the stored status
+        
+        return [process for process in children if process.poll() is not None]
+    
+    def _restart_delay(self, failures: int) -> float:
+        """Backoff before the next restart: 1, 2, 4, ... seconds, capped"""
+        return min(RESTART_BACKOFF_CAP, 2 ** failures)
+    
+    def _monitor_timeout(self) -> float:
+        """Seconds until the monitor must wake: 30, or sooner when a restart is due"""
+        timeout = 30.0
+        now = time.monotonic()
+        for name, process, _ in self._managed_children():
+            failures, last_restart = self._restart_state[name]
+            if process and process.returncode is not None and failures < MAX_RESTART_ATTEMPTS:
+                timeout = min(timeout, max(0.0, last_restart + self._restart_delay(failures) - now))
+        return timeout
+    
+    def _restart_with_backoff(self, name: str, start) -> None:
+        """Restart an exited child unless it is still backing off or has given up"""
+        failures, last_restart = self._restart_state[name]
+        if failures >= MAX_RESTART_ATTEMPTS:
+            return
+        if time.monotonic() - last_restart < self._restart_delay(failures):
+            return
+        
+        logger.info(f"Restarting {name} (attempt {failures + 1})...")
+        start()
+        failures += 1
+        self._restart_state[name] = (failures, time.monotonic())
+        
+        if failures >= MAX_RESTART_ATTEMPTS:
+            logger.error(f"{name.capitalize()} restarted {failures} times in a row, giving up")
+    
     async def monitor_processes(self):
         """Monitor running processes and restart if needed"""
         logger.info("Starting process monitoring...")
         
         while not self.shutdown_requested:
             try:
-                await asyncio.sleep(30)  # Check every 30 seconds
+                # Sleep until SIGCHLD reports an exit, a restart backoff expires,
+                # or 30 seconds pass
+                try:
+                    await asyncio.wait_for(self._child_event.wait(), timeout=self._monitor_timeout())
+                except asyncio.TimeoutError:
+                    pass
+                self._child_event.clear()
+                
+                if self.shutdown_requested:
+                    break
                 
-                if not self.check_health():
-                    logger.warning("Health check failed, attempting restart...")
-                    
-                    # Restart backend if needed
-                    if self.backend_process and self.backend_process.poll() is not None:
-                        logger.info("Restarting backend...")
-                        self.start_backend()
-                    
-                    # Restart frontend if needed
-                    if self.frontend_process and self.frontend_process.poll() is not None:
-                        logger.info("Restarting frontend...")
-                        self.start_frontend()
+                exited = self._exited_children()
+                for name, process, start in self._managed_children():
+                    if process in exited:
+                        self._restart_with_backoff(name, start)
+                
+                # Restarted children that stay up and healthy clear their backoff
+                restarting = any(failures for failures, _ in self._restart_state.values())
+                if restarting and not exited and self.check_health():
+                    self._restart_state = {name: (0, 0.0) for name in self._restart_state}
                 
             except asyncio.CancelledError:
                 break
@@ -235,24 +336,10 @@ class AIAssistantLauncher:
         # Stop monitoring
         self.shutdown_requested = True
         
-        # Terminate processes gracefully
-        for process in self.processes:
-            if process and process.poll() is None:
-                try:
-                    # Try graceful termination first
-                    process.terminate()
-                    
-                    # Wait for graceful shutdown
-                    try:
-                        process.wait(timeout=10)
-                    except subprocess.TimeoutExpired:
-                        # Force kill if graceful shutdown fails
-                        logger.warning(f"Force killing process {process.pid}")
-                        process.kill()
-                        process.wait()
-                        
-                except Exception as e:
-                    logger.error(f"Error terminating process: {e}")
+        # Stop the children off the event loop; they share one 10 second timeout
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._stop_processes, self._children())
+        self._close_http()
         
         logger.info("AI Assistant shutdown complete")
     
@@ -260,6 +347,13 @@ class AIAssistantLauncher:
         """Main application runner"""
         logger.info("Starting AI Assistant Desktop Application...")
         
+        # Bind the shutdown event to the running loop for the signal handler
+        self._loop = asyncio.get_running_loop()
+        self._shutdown_event = asyncio.Event()
+        self._child_event = asyncio.Event()
+        if self.shutdown_requested:
+            self._shutdown_event.set()
+        
         try:
             # Check dependencies
             if not self.check_dependencies():
@@ -285,8 +379,7 @@ class AIAssistantLauncher:
             monitor_task = asyncio.create_task(self.monitor_processes())
             
             # Wait for shutdown signal
-            while not self.shutdown_requested:
-                await asyncio.sleep(1)
+            await self._shutdown_event.wait()
             
             # Cancel monitoring
             monitor_task.cancel()
@@ -295,6 +388,7 @@ class AIAssistantLauncher:
             except asyncio.CancelledError:
                 pass
             
+            await self.shutdown()
             return True
             
         except Exception as e:
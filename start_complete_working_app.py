@@ -9,13 +9,25 @@ import logging
 import sys
 import os
 import subprocess
-import time
 import webbrowser
-import threading
+import re
 import json
 import signal
+import hashlib
+import importlib.metadata
 from pathlib import Path
 
+from launcher_core import (
+    BACKEND_PORT, BaseLauncher, content_fingerprint, read_fingerprint,
+    wait_ready, write_fingerprint
+)
+
+try:
+    from packaging.specifiers import SpecifierSet
+    PACKAGING_AVAILABLE = True
+except ImportError:
+    PACKAGING_AVAILABLE = False
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,14 +35,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class CompleteAIAssistant:
+def _version_tuple(version):
+    """Leading numeric components of a version string, e.g. '2.31.0rc1' -> (2, 31, 0)"""
+    match = re.match(r"\d+(?:\.\d+)*", version)
+    return tuple(int(part) for part in match.group(0).split(".")) if match else ()
+
+def _requirement_satisfied(requirement):
+    """Check a 'name[extra]>=x.y' requirement against installed metadata"""
+    name, _, minimum = requirement.partition(">=")
+    name = name.split("[", 1)[0]
+    try:
+        installed = importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    if not minimum:
+        return True
+    if PACKAGING_AVAILABLE:
+        return SpecifierSet(f">={minimum}").contains(installed, prereleases=True)
+    return _version_tuple(installed) >= _version_tuple(minimum)
+
+class CompleteAIAssistant(BaseLauncher):
     def __init__(self):
-        self.root_dir = Path(__file__).parent
-        self.backend_dir = self.root_dir / "backend"
-        self.frontend_dir = self.root_dir / "frontend"
-        self.backend_process = None
-        self.frontend_process = None
+        super().__init__()
+        self.deps_cache_file = self.root_dir / ".deps_cache.json"
         self.running = False
+        self._loop = None
+        self._stop_event = None
         
     def check_dependencies(self):
         """Check and install required dependencies"""
@@ -59,62 +89,72 @@ class CompleteAIAssistant:
             "requests>=2.31.0"
         ]
         
-        logger.info("📦 Installing backend dependencies...")
-        for package in backend_packages:
-            try:
-                subprocess.check_call([
-                    sys.executable, "-m", "pip", "install", package
+        if self._deps_cached(backend_packages):
+            logger.info("✅ Backend dependencies ready (cached)")
+        else:
+            missing = [p for p in backend_packages if not _requirement_satisfied(p)]
+            installed = True
+            if missing:
+                logger.info(f"📦 Installing backend dependencies: {', '.join(missing)}")
+                result = subprocess.run([
+                    sys.executable, "-m", "pip", "install",
+                    "--disable-pip-version-check", "--no-input", *missing
                 ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            except subprocess.CalledProcessError:
-                logger.warning(f"⚠️ Failed to install {package}")
-        
-        logger.info("✅ Backend dependencies ready")
+                if result.returncode != 0:
+                    installed = False
+                    logger.warning(f"⚠️ Failed to install {', '.join(missing)}")
+            
+            if installed:
+                self._save_deps_cache(backend_packages)
+            logger.info("✅ Backend dependencies ready")
         
         # Check Node.js for frontend
-        try:
-            node_result = subprocess.run(["node", "--version"], capture_output=True, text=True)
-            npm_result = subprocess.run(["npm", "--version"], capture_output=True, text=True)
-            
-            if node_result.returncode == 0 and npm_result.returncode == 0:
-                logger.info(f"✅ Node.js {node_result.stdout.strip()}")
-                logger.info(f"✅ npm {npm_result.stdout.strip()}")
-                return True
-            else:
-                logger.warning("⚠️ Node.js/npm not found - will use web interface only")
-                return True
-                
-        except FileNotFoundError:
+        tools = self._find_node_tools()
+        if tools:
+            logger.info(f"✅ Node.js {tools['node_version']}")
+            logger.info(f"✅ npm {tools['npm_version']}")
+        else:
             logger.warning("⚠️ Node.js/npm not found - will use web interface only")
-            return True
+        return True
+    
+    def _deps_cache_key(self, packages):
+        """Cache key for a dependency set under the current interpreter"""
+        digest = hashlib.sha256("\n".join(sorted(packages)).encode("utf-8")).hexdigest()
+        return {"python": sys.executable, "packages": digest}
+    
+    def _deps_cached(self, packages):
+        """Check whether this dependency set was already satisfied on a previous run"""
+        try:
+            cached = json.loads(self.deps_cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        return cached == self._deps_cache_key(packages)
+    
+    def _save_deps_cache(self, packages):
+        """Record that this dependency set is satisfied"""
+        try:
+            self.deps_cache_file.write_text(
+                json.dumps(self._deps_cache_key(packages)), encoding="utf-8"
+            )
+        except OSError as e:
+            logger.debug(f"Could not write dependency cache: {e}")
     
     def start_backend(self):
         """Start the backend server"""
         logger.info("🚀 Starting AI Assistant Backend...")
         
-        # Add backend to Python path
-        sys.path.insert(0, str(self.backend_dir))
-        
         try:
-            # Import the backend main module
-            os.chdir(self.backend_dir)
-            
             # Start backend in a separate process
-            self.backend_process = subprocess.Popen([
-                sys.executable, "main.py"
-            ], cwd=self.backend_dir)
+            self.backend_process = self._spawn([sys.executable, "main.py"], cwd=self.backend_dir)
             
-            # Wait for backend to start
-            time.sleep(5)
-            
-            # Test if backend is running
-            try:
-                import requests
-                response = requests.get("http://localhost:8000/health", timeout=5)
-                if response.status_code == 200:
-                    logger.info("✅ Backend server started successfully")
-                    return True
-            except:
-                pass
+            # Wait for backend to accept connections, then confirm health
+            if wait_ready(BACKEND_PORT, process=self.backend_process):
+                try:
+                    if self._backend_healthy(timeout=5):
+                        logger.info("✅ Backend server started successfully")
+                        return True
+                except:
+                    pass
             
             logger.info("✅ Backend server started")
             return True
@@ -130,30 +170,44 @@ class CompleteAIAssistant:
             return self.open_web_interface()
         
         try:
-            # Check if we can build/start Electron
-            os.chdir(self.frontend_dir)
-            
-            # Install dependencies
-            logger.info("📦 Installing frontend dependencies...")
-            result = subprocess.run(["npm", "install"], capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                logger.warning("⚠️ npm install failed, using web interface")
-                return self.open_web_interface()
-            
-            # Try to build
-            logger.info("🔨 Building frontend...")
-            result = subprocess.run(["npm", "run", "build"], capture_output=True, text=True)
+            # Install dependencies, unless package.json/package-lock.json are
+            # unchanged since the last successful install
+            manifests = (self.frontend_dir / "package.json", self.frontend_dir / "package-lock.json")
+            install_marker = self.frontend_dir / "node_modules" / ".install_fingerprint"
+            if read_fingerprint(install_marker) == content_fingerprint(*manifests):
+                logger.info("✅ Frontend dependencies up to date")
+            else:
+                logger.info("📦 Installing frontend dependencies...")
+                result = subprocess.run(
+                    ["npm", "install"], cwd=self.frontend_dir, capture_output=True, text=True
+                )
+                
+                if result.returncode != 0:
+                    logger.warning("⚠️ npm install failed, using web interface")
+                    return self.open_web_interface()
+                
+                # npm install may rewrite package-lock.json, so hash it afterwards
+                write_fingerprint(install_marker, content_fingerprint(*manifests))
             
-            if result.returncode != 0:
-                logger.warning("⚠️ Frontend build failed, using web interface")
-                return self.open_web_interface()
+            # Try to build, unless the sources are unchanged since the last build
+            build_fingerprint = self._build_fingerprint()
+            if read_fingerprint(self.build_marker) == build_fingerprint:
+                logger.info("✅ Frontend build up to date")
+            else:
+                logger.info("🔨 Building frontend...")
+                result = subprocess.run(
+                    ["npm", "run", "build"], cwd=self.frontend_dir, capture_output=True, text=True
+                )
+                
+                if result.returncode != 0:
+                    logger.warning("⚠️ Frontend build failed, using web interface")
+                    return self.open_web_interface()
+                
+                write_fingerprint(self.build_marker, build_fingerprint)
             
             # Start Electron
             logger.info("🖥️ Starting Electron app...")
-            self.frontend_process = subprocess.Popen([
-                "npm", "start"
-            ], cwd=self.frontend_dir)
+            self.frontend_process = self._spawn(["npm", "start"], cwd=self.frontend_dir)
             
             logger.info("✅ Electron app started")
             return True
@@ -166,18 +220,19 @@ class CompleteAIAssistant:
         """Open web interface as fallback"""
         logger.info("🌐 Opening web interface...")
         
-        def open_browser():
-            time.sleep(3)  # Wait for backend
-            try:
-                webbrowser.open("http://localhost:8000/static/")
-                logger.info("✅ Web interface opened")
-            except Exception as e:
-                logger.warning(f"⚠️ Could not open browser: {e}")
-                logger.info("📍 Manual access: http://localhost:8000/static/")
-        
-        threading.Thread(target=open_browser, daemon=True).start()
+        # Give the backend a moment, then open the browser from the event loop
+        self._loop.call_later(3.0, self._open_browser, "http://localhost:8000/static/")
         return True
     
+    def _open_browser(self, url):
+        """Open url in the default browser, pointing at it manually if that fails"""
+        try:
+            webbrowser.open(url)
+            logger.info("✅ Web interface opened")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not open browser: {e}")
+            logger.info(f"📍 Manual access: {url}")
+    
     def create_desktop_shortcut(self):
         """Create desktop shortcut"""
         try:
@@ -194,8 +249,6 @@ cd /d "{self.root_dir}"
 pause
 '''
                 shortcut_path = desktop / "AI Assistant.bat"
-                with open(shortcut_path, 'w') as f:
-                    f.write(shortcut_content)
             else:
                 shortcut_content = f'''#!/bin/bash
 echo "Starting AI Assistant Desktop..."
@@ -203,8 +256,18 @@ cd "{self.root_dir}"
 "{sys.executable}" start_complete_working_app.py
 '''
                 shortcut_path = desktop / "ai_assistant.sh"
-                with open(shortcut_path, 'w') as f:
-                    f.write(shortcut_content)
+            
+            # Leave an identical shortcut untouched to avoid needless writes
+            # (and desktop indexer churn) on every launch
+            try:
+                if shortcut_path.read_text() == shortcut_content:
+                    return
+            except (OSError, ValueError):
+                pass
+            
+            with open(shortcut_path, 'w') as f:
+                f.write(shortcut_content)
+            if sys.platform != "win32":
                 os.chmod(shortcut_path, 0o755)
             
             logger.info("✅ Desktop shortcut created")
@@ -216,8 +279,11 @@ cd "{self.root_dir}"
         """Setup signal handlers for graceful shutdown"""
         def signal_handler(signum, frame):
             logger.info("🛑 Shutdown signal received")
-            self.shutdown()
-            sys.exit(0)
+            if self.running:
+                # Wake run(), which shuts down on its way out
+                self._loop.call_soon_threadsafe(self._stop_event.set)
+            else:
+                sys.exit(0)  # Still starting up
         
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
@@ -230,19 +296,8 @@ cd "{self.root_dir}"
         self.running = False
         logger.info("🛑 Shutting down AI Assistant...")
         
-        if self.frontend_process:
-            try:
-                self.frontend_process.terminate()
-                self.frontend_process.wait(timeout=5)
-            except:
-                self.frontend_process.kill()
-        
-        if self.backend_process:
-            try:
-                self.backend_process.terminate()
-                self.backend_process.wait(timeout=10)
-            except:
-                self.backend_process.kill()
+        self._stop_processes(self._children())
+        self._close_http()
         
         logger.info("✅ Shutdown complete")
     
@@ -276,6 +331,13 @@ cd "{self.root_dir}"
         print("🤖 AI Assistant Desktop - Complete Working Application")
         print("=" * 70)
         
+        return asyncio.run(self._run())
+    
+    async def _run(self):
+        """Start everything, then idle on the event loop until a shutdown signal"""
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        
         # Setup signal handlers
         self.setup_signal_handlers()
         
@@ -296,13 +358,10 @@ cd "{self.root_dir}"
         # Print status
         self.print_status()
         
-        # Keep running
+        # Keep running; the loop sleeps until a signal sets the stop event
         self.running = True
         try:
-            while self.running:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            pass
+            await self._stop_event.wait()
         finally:
             self.shutdown()
         